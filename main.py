@@ -1,7 +1,14 @@
 import streamlit as st
 import yaml
-import copy
+import os
+import numpy as np
 import pandas as pd
+import plotly.graph_objects as go
+
+from storage import SqliteStorage, YamlStorage
+
+# Where the knowledge map is kept: "sqlite" (learn.db) or "yaml" (learn.yaml)
+STORAGE_BACKEND = os.environ.get("APORIA_STORAGE", "sqlite")
 
 
 # Set page config
@@ -191,15 +198,13 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 def load_data():
-    """Load YAML data from file with graceful error handling"""
+    """Load YAML data from file with graceful error handling (None if it couldn't be read)"""
     try:
         with open("learn.yaml", "r") as file:
-            data = yaml.safe_load(file)
-            original_data = copy.deepcopy(data)
-        return data, original_data
+            return yaml.safe_load(file) or {}
     except Exception as e:
         st.error(f"Error loading data: {e}")
-        return {}, {}
+        return None
 
 def save_data(data):
     """Save YAML data to file with graceful error handling"""
@@ -211,9 +216,39 @@ def save_data(data):
         st.error(f"Error saving data: {e}")
         return False
 
+@st.cache_resource
+def open_storage(backend):
+    """Open a storage backend once and share it between sessions"""
+    if backend == "yaml":
+        return YamlStorage("learn.yaml")
+    return SqliteStorage("learn.db")
+
+def get_storage():
+    """Open the knowledge map storage, seeding a new database from learn.yaml"""
+    if STORAGE_BACKEND == "yaml":
+        return open_storage("yaml")
+
+    storage = open_storage("sqlite")
+    if storage.version() == 0:
+        # Only seed from a learn.yaml that loaded, so a broken file is retried on the next run
+        data = load_data()
+        if data is None or not commit_edit(storage.import_data, data):
+            st.warning("Couldn't set up the knowledge database, so changes go straight to learn.yaml for now.")
+            return open_storage("yaml")
+    return storage
+
+def commit_edit(edit, *args):
+    """Apply a single edit to storage with graceful error handling"""
+    try:
+        edit(*args)
+        return True
+    except Exception as e:
+        st.error(f"Error saving changes: {e}")
+        return False
+
 def format_key_display(key):
     """Convert keys like 'Snake_Case' to 'Snake Case' for natural reading"""
-    return key.replace('_', ' ')
+    return str(key).replace('_', ' ')
 
 def display_breadcrumb(path):
     """Display a friendly breadcrumb navigation"""
@@ -229,9 +264,9 @@ def display_breadcrumb(path):
 
     st.markdown(breadcrumb_html, unsafe_allow_html=True)
 
-def browse_topics(data):
+def browse_topics(storage):
     """Natural knowledge browsing experience"""
-    current_data = data
+    kind = storage.kind([])
     path = []
 
     # Navigation
@@ -240,8 +275,12 @@ def browse_topics(data):
         st.markdown("Navigate through topics that interest you.")
 
         # Create a natural topic navigation
-        while isinstance(current_data, dict) and current_data:
-            keys = list(current_data.keys())
+        while kind == "dict":
+            # Only the children of each selected category are fetched
+            children = storage.children(path)
+            if not children:
+                break
+            keys = list(children.keys())
 
             # Determine the navigation prompt based on the depth
             if not path:
@@ -259,7 +298,18 @@ def browse_topics(data):
             )
 
             path.append(selected_key)
-            current_data = current_data[selected_key]
+            kind = children[selected_key]
+
+    if not path:
+        st.markdown("""
+        <div class="empty-state">
+            <p>Your knowledge map is empty. Let's add some topics first!</p>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+
+    # Fetch just the topic being shown
+    current_data = storage.get(path)
 
     # Content display
     display_breadcrumb(path)
@@ -324,33 +374,25 @@ def browse_topics(data):
                 </div>
                 """, unsafe_allow_html=True)
 
-def build_knowledge_tree(data, parent_stack=None, add_direct_item=False):
+def build_knowledge_tree(storage, path=None, add_direct_item=False):
     """Interactive knowledge tree builder"""
-    # Initialize parent stack if not provided
-    if parent_stack is None:
-        parent_stack = []
-
-    # Start with empty path
-    path_crumbs = []
-
-    # If we have parents in the stack, build path
-    for parent_info in parent_stack:
-        _, key = parent_info
-        path_crumbs.append(key)
+    # Start at the root if no path is provided
+    if path is None:
+        path = []
 
     # Show navigation breadcrumbs if we're not at the root
-    if path_crumbs:
-        display_breadcrumb(path_crumbs)
+    if path:
+        display_breadcrumb(path)
 
-    # Current data reference
-    if parent_stack:
-        current_data = parent_stack[-1][0][parent_stack[-1][1]]
+    # Categories only need their children's names and kinds; leaves are loaded in full
+    if storage.kind(path) == "dict":
+        current_data = storage.children(path)
     else:
-        current_data = data
+        current_data = storage.get(path)
 
     # If we want to add a direct item without selecting a node first
     if add_direct_item:
-        return add_new_item(current_data, parent_stack, path_crumbs)
+        return add_new_item(storage, current_data, path)
 
     # Interactive node selection
     if isinstance(current_data, dict) and current_data:
@@ -369,24 +411,22 @@ def build_knowledge_tree(data, parent_stack=None, add_direct_item=False):
             with cols[col_idx]:
                 if key == "➕ Add new topic here":
                     # Special card for adding new topic
-                    if st.button(key, key=f"add_btn_{len(path_crumbs)}", use_container_width=True):
-                        return add_new_item(current_data, parent_stack, path_crumbs)
+                    if st.button(key, key=f"add_btn_{len(path)}", use_container_width=True):
+                        return add_new_item(storage, current_data, path)
                 else:
                     # Regular node selection
-                    if st.button(format_key_display(key), key=f"select_{key}", use_container_width=True):
+                    if st.button(format_key_display(key), key=f"select_{key!r}", use_container_width=True):
                         # Navigate to selected node
-                        new_stack = parent_stack.copy()
-                        new_stack.append((current_data, key))
-                        return build_knowledge_tree(data, new_stack)
+                        return build_knowledge_tree(storage, path + [key])
 
     # If we've reached a leaf node or an empty dictionary, show editing options
-    return edit_current_node(current_data, parent_stack, path_crumbs)
+    return edit_current_node(storage, current_data, path)
 
-def add_new_item(current_data, parent_stack, path_crumbs):
+def add_new_item(storage, current_data, path):
     """UI for adding a new knowledge item"""
     if not isinstance(current_data, dict):
         st.error("Can only add items to a category. Please select a category first.")
-        return current_data, parent_stack
+        return path
 
     st.markdown("""
     <div class="action-panel">
@@ -427,14 +467,11 @@ def add_new_item(current_data, parent_stack, path_crumbs):
             with col2:
                 if st.button("Add to Knowledge Map", use_container_width=True):
                     if clean_key not in current_data:
-                        current_data[clean_key] = content
-                        st.success(f"Added '{topic_name}' to your knowledge map!")
-                        st.balloons()
-                        # Return to parent view
-                        if len(parent_stack) > 0:
-                            return current_data, parent_stack[:-1]
-                        else:
-                            return current_data, []
+                        if commit_edit(storage.set, path + [clean_key], content):
+                            st.success(f"Added '{topic_name}' to your knowledge map!")
+                            st.balloons()
+                            # Return to parent view
+                            return path[:-1]
                     else:
                         st.error(f"'{topic_name}' already exists!")
 
@@ -458,18 +495,16 @@ def add_new_item(current_data, parent_stack, path_crumbs):
                         for subtopic in subtopic_list:
                             clean_subtopic = subtopic.replace(' ', '_')
                             subtopic_dict[clean_subtopic] = ""
-                        current_data[clean_key] = subtopic_dict
                     else:
                         # Empty category
-                        current_data[clean_key] = {}
+                        subtopic_dict = {}
 
-                    st.success(f"Created '{topic_name}' category!")
-                    st.balloons()
+                    if commit_edit(storage.set, path + [clean_key], subtopic_dict):
+                        st.success(f"Created '{topic_name}' category!")
+                        st.balloons()
 
-                    # Navigate to the new category
-                    new_stack = parent_stack.copy()
-                    new_stack.append((current_data, clean_key))
-                    return current_data, new_stack
+                        # Navigate to the new category
+                        return path + [clean_key]
                 else:
                     st.error(f"'{topic_name}' already exists!")
 
@@ -484,29 +519,23 @@ def add_new_item(current_data, parent_stack, path_crumbs):
 
             if st.button("Create List", use_container_width=True):
                 if clean_key not in current_data:
-                    current_data[clean_key] = item_list
-                    st.success(f"Created '{topic_name}' list!")
-                    st.balloons()
-                    # Return to parent view
-                    if len(parent_stack) > 0:
-                        return current_data, parent_stack[:-1]
-                    else:
-                        return current_data, []
+                    if commit_edit(storage.set, path + [clean_key], item_list):
+                        st.success(f"Created '{topic_name}' list!")
+                        st.balloons()
+                        # Return to parent view
+                        return path[:-1]
                 else:
                     st.error(f"'{topic_name}' already exists!")
 
     # Cancel button
     if st.button("← Go Back"):
-        if len(parent_stack) > 0:
-            return current_data, parent_stack[:-1]
-        else:
-            return current_data, []
+        return path[:-1]
 
-    return current_data, parent_stack
+    return path
 
-def edit_current_node(current_data, parent_stack, path_crumbs):
+def edit_current_node(storage, current_data, path):
     """UI for editing the currently selected node"""
-    if not path_crumbs:
+    if not path:
         # Root level - nothing to edit
         st.markdown("""
         <div class="welcome-box">
@@ -517,14 +546,14 @@ def edit_current_node(current_data, parent_stack, path_crumbs):
 
         # Option to add a top-level topic
         if st.button("➕ Add New Top-Level Topic", use_container_width=True):
-            return add_new_item(current_data, parent_stack, path_crumbs)
+            return add_new_item(storage, current_data, path)
 
-        return current_data, parent_stack
+        return path
 
     # We have a selected node - show editing options
     st.markdown(f"""
     <div class="action-panel">
-        <h2>✏️ Edit: {format_key_display(path_crumbs[-1])}</h2>
+        <h2>✏️ Edit: {format_key_display(path[-1])}</h2>
         <p>What would you like to change about this knowledge?</p>
     </div>
     """, unsafe_allow_html=True)
@@ -539,27 +568,23 @@ def edit_current_node(current_data, parent_stack, path_crumbs):
         with col1:
             if st.button("Save Changes", use_container_width=True):
                 if new_content != current_data:
-                    parent, key = parent_stack[-1]
-                    parent[key] = new_content
-                    st.success("Saved your changes!")
+                    if commit_edit(storage.set, path, new_content):
+                        st.success("Saved your changes!")
                     # Stay on the same node
-                    return current_data, parent_stack
+                    return path
 
         with col2:
             if st.button("← Go Back", use_container_width=True):
                 # Navigate up one level
-                if len(parent_stack) > 0:
-                    return current_data, parent_stack[:-1]
+                return path[:-1]
 
         with col3:
             if st.button("🗑️ Delete", use_container_width=True, help="Delete this item"):
-                if len(parent_stack) > 0:
-                    parent, key = parent_stack[-1]
-                    if st.checkbox(f"Confirm deletion of '{format_key_display(key)}'"):
-                        del parent[key]
-                        st.success(f"Deleted '{format_key_display(key)}'")
+                if st.checkbox(f"Confirm deletion of '{format_key_display(path[-1])}'"):
+                    if commit_edit(storage.delete, path):
+                        st.success(f"Deleted '{format_key_display(path[-1])}'")
                         # Navigate up one level
-                        return current_data, parent_stack[:-1]
+                        return path[:-1]
 
     elif isinstance(current_data, list):
         # Edit list content
@@ -589,27 +614,23 @@ def edit_current_node(current_data, parent_stack, path_crumbs):
         with col1:
             if st.button("Save Changes", use_container_width=True):
                 if new_list != current_data:
-                    parent, key = parent_stack[-1]
-                    parent[key] = new_list
-                    st.success("List updated successfully!")
+                    if commit_edit(storage.set, path, new_list):
+                        st.success("List updated successfully!")
                     # Stay on the same node
-                    return current_data, parent_stack
+                    return path
 
         with col2:
             if st.button("← Go Back", use_container_width=True):
                 # Navigate up one level
-                if len(parent_stack) > 0:
-                    return current_data, parent_stack[:-1]
+                return path[:-1]
 
         with col3:
             if st.button("🗑️ Delete", use_container_width=True, help="Delete this list"):
-                if len(parent_stack) > 0:
-                    parent, key = parent_stack[-1]
-                    if st.checkbox(f"Confirm deletion of '{format_key_display(key)}'"):
-                        del parent[key]
-                        st.success(f"Deleted '{format_key_display(key)}'")
+                if st.checkbox(f"Confirm deletion of '{format_key_display(path[-1])}'"):
+                    if commit_edit(storage.delete, path):
+                        st.success(f"Deleted '{format_key_display(path[-1])}'")
                         # Navigate up one level
-                        return current_data, parent_stack[:-1]
+                        return path[:-1]
 
     elif isinstance(current_data, dict):
         # Edit dictionary/category
@@ -617,13 +638,13 @@ def edit_current_node(current_data, parent_stack, path_crumbs):
 
         # Show current subtopics
         if current_data:
-            st.markdown(f"#### Current items in {format_key_display(path_crumbs[-1])}")
+            st.markdown(f"#### Current items in {format_key_display(path[-1])}")
 
-            for key, value in current_data.items():
-                content_type = "📝 Text" if isinstance(value, str) else "📋 List" if isinstance(value, list) else "📁 Category"
+            for key, kind in current_data.items():
+                content_type = "📁 Category" if kind == "dict" else "📋 List" if kind == "list" else "📝 Text"
                 st.markdown(f"- {content_type}: **{format_key_display(key)}**")
         else:
-            st.info(f"This category is empty. Add some knowledge to {format_key_display(path_crumbs[-1])}!")
+            st.info(f"This category is empty. Add some knowledge to {format_key_display(path[-1])}!")
 
         # Buttons for actions
         col1, col2, col3 = st.columns([1, 1, 1])
@@ -631,30 +652,211 @@ def edit_current_node(current_data, parent_stack, path_crumbs):
         with col1:
             if st.button("➕ Add New Item", use_container_width=True):
                 # Navigate to add item view
-                return add_new_item(current_data, parent_stack, path_crumbs)
+                return add_new_item(storage, current_data, path)
 
         with col2:
             if st.button("← Go Back", use_container_width=True):
                 # Navigate up one level
-                if len(parent_stack) > 0:
-                    return current_data, parent_stack[:-1]
+                return path[:-1]
 
         with col3:
             if st.button("🗑️ Delete", use_container_width=True, help="Delete this category"):
-                if len(parent_stack) > 0:
-                    parent, key = parent_stack[-1]
-                    st.warning(f"This will delete '{format_key_display(key)}' and ALL its contents!")
-                    if st.checkbox(f"Yes, permanently delete '{format_key_display(key)}'"):
-                        del parent[key]
-                        st.success(f"Deleted '{format_key_display(key)}'")
+                st.warning(f"This will delete '{format_key_display(path[-1])}' and ALL its contents!")
+                if st.checkbox(f"Yes, permanently delete '{format_key_display(path[-1])}'"):
+                    if commit_edit(storage.delete, path):
+                        st.success(f"Deleted '{format_key_display(path[-1])}'")
                         # Navigate up one level
-                        return current_data, parent_stack[:-1]
+                        return path[:-1]
+
+    return path
+
+# Most nodes the overview sends to the browser at once
+OVERVIEW_MAX_NODES = 5000
+
+# Most branches offered when zooming into one level of the map
+OVERVIEW_MAX_BRANCHES = 200
+
+@st.cache_resource(max_entries=2, show_spinner="Mapping your knowledge...")
+def compute_tree_layout(version, _storage):
+    """Turn the pre-order walk of the knowledge map into NumPy arrays, once per stored version"""
+    labels, parents, depths, gaps = _storage.preorder()
+
+    label = np.array(labels, dtype=object)
+    label[0] = "Knowledge Map"
+    parent = np.asarray(parents, dtype=np.int64)
+    depth = np.asarray(depths, dtype=np.int32)
+    gap = np.asarray(gaps, dtype=bool)
+
+    # Roll subtree node and gap counts up one level at a time, deepest first
+    size = np.ones(len(label), dtype=np.int64)
+    gap_count = gap.astype(np.int64)
+    for level in range(int(depth.max()), 0, -1):
+        nodes = np.flatnonzero(depth == level)
+        np.add.at(size, parent[nodes], size[nodes])
+        np.add.at(gap_count, parent[nodes], gap_count[nodes])
+
+    return {
+        "label": label,
+        "parent": parent,
+        "depth": depth,
+        "size": size,
+        "gap": gap,
+        "gap_count": gap_count,
+        "gap_ratio": gap_count / size,
+    }
+
+def layout_children(layout, index):
+    """Direct children of a node in pre-order; each subtree is a contiguous range after it"""
+    start, end = index + 1, index + layout["size"][index]
+    return start + np.flatnonzero(layout["depth"][start:end] == layout["depth"][index] + 1)
+
+def largest_nodes(layout, nodes, limit):
+    """Split nodes into the `limit` largest subtrees (kept in pre-order) and the rest"""
+    if len(nodes) <= limit:
+        return nodes, nodes[:0]
+
+    order = np.argsort(-layout["size"][nodes], kind="stable")
+    return np.sort(nodes[order[:limit]]), np.sort(nodes[order[limit:]])
+
+def visible_nodes(layout, root, levels, budget=OVERVIEW_MAX_NODES):
+    """Level-of-detail culling: keep the nodes within `levels` of root, shrinking to fit the budget
+
+    Returns the visible nodes, the number of levels drawn and, when even the
+    first level is too wide, the children folded away as (count, size, gaps).
+    """
+    start, end = root, root + layout["size"][root]
+    relative_depth = layout["depth"][start:end] - layout["depth"][root]
+
+    # Nodes shown when drawing down to each depth
+    cumulative = np.cumsum(np.bincount(relative_depth))
+    levels = min(levels, len(cumulative) - 1)
+    while levels > 1 and cumulative[levels] > budget:
+        levels -= 1
+
+    if cumulative[levels] <= budget:
+        return start + np.flatnonzero(relative_depth <= levels), levels, None
+
+    # A single level is too wide: keep the largest children and fold the rest into one node
+    kept, folded = largest_nodes(layout, layout_children(layout, root), budget - 2)
+    nodes = np.concatenate(([root], kept))
+    return nodes, 1, (len(folded), int(layout["size"][folded].sum()), int(layout["gap_count"][folded].sum()))
+
+def render_overview_chart(layout, nodes, chart_type, folded=None):
+    """Draw the visible nodes as a treemap or sunburst, coloured by their share of gaps"""
+    ids = list(nodes.astype(str))
+    parents = list(layout["parent"][nodes].astype(str))
+    parents[0] = ""  # The zoomed-in branch becomes the chart root
+    labels = [format_key_display(label) for label in layout["label"][nodes]]
+    values = list(layout["size"][nodes])
+    colors = list(layout["gap_ratio"][nodes])
+
+    # Children that didn't fit are drawn as one combined node
+    if folded:
+        count, size, gaps = folded
+        ids.append("more")
+        parents.append(ids[0])
+        labels.append(f"… {count} more")
+        values.append(size)
+        colors.append(gaps / size)
+
+    chart = go.Treemap if chart_type == "Treemap" else go.Sunburst
+    fig = go.Figure(chart(
+        ids=ids,
+        labels=labels,
+        parents=parents,
+        values=values,
+        branchvalues="total",
+        marker=dict(
+            colors=colors,
+            colorscale=[[0, "#96BAFF"], [1, "#FF6B6B"]],
+            cmin=0,
+            cmax=1,
+            colorbar=dict(title="Gaps", tickformat=".0%")
+        ),
+        hovertemplate="<b>%{label}</b><br>%{value} topics<br>%{color:.0%} still empty<extra></extra>"
+    ))
+    fig.update_layout(margin=dict(t=10, l=10, r=10, b=10), height=600)
+
+    st.plotly_chart(fig, use_container_width=True)
+
+def show_knowledge_overview(storage):
+    """Whole-map overview to spot the shape of your knowledge and its gaps"""
+    layout = compute_tree_layout(storage.version(), storage)
+
+    if layout["size"][0] <= 1:
+        st.markdown("""
+        <div class="empty-state">
+            <p>Your knowledge map is empty. Let's add some topics first!</p>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+
+    st.markdown("## 🌳 Your Knowledge at a Glance")
+    st.markdown("Each area is sized by how many topics it holds. The redder it is, the more gaps are waiting for a description.")
+
+    # Zoom into a branch of the map
+    focus = 0
+    focus_path = []
+    with st.expander("🔍 Zoom into a branch"):
+        while True:
+            children = layout_children(layout, focus)
+            branches, hidden = largest_nodes(layout, children[layout["size"][children] > 1], OVERVIEW_MAX_BRANCHES)
+            if not len(branches):
+                break
+            branches = branches[np.argsort(-layout["size"][branches], kind="stable")]  # Largest first
+
+            choice = st.selectbox(
+                "Focus on" if not focus_path else f"Within {format_key_display(focus_path[-1])}",
+                [None] + branches.tolist(),
+                key=f"overview_focus_{len(focus_path)}",
+                format_func=lambda i: "The whole branch" if i is None else format_key_display(layout["label"][i])
+            )
+            if len(hidden):
+                st.caption(f"Showing the {len(branches)} largest of {len(branches) + len(hidden)} branches.")
+            if choice is None:
+                break
+
+            focus = choice
+            focus_path.append(layout["label"][choice])
+
+    display_breadcrumb(focus_path)
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        chart_type = st.radio("Chart style", ["Treemap", "Sunburst"], horizontal=True, key="overview_chart")
+
+    with col2:
+        max_levels = int(layout["depth"][focus:focus + layout["size"][focus]].max() - layout["depth"][focus])
+        if max_levels > 1:
+            levels = st.slider("Levels of detail", 1, max_levels, min(3, max_levels), key="overview_levels")
+        else:
+            levels = 1
+
+    nodes, shown_levels, folded = visible_nodes(layout, focus, levels)
+    if folded:
+        st.caption(f"Showing the {len(nodes) - 1} largest topics here; {folded[0]} smaller ones are grouped together.")
+    elif shown_levels < levels:
+        st.caption(f"Showing {shown_levels} levels to keep things quick. Zoom into a branch to see more detail.")
+
+    render_overview_chart(layout, nodes, chart_type, folded)
 
-    return current_data, parent_stack
+    # List the empty topics inside the current (culled) view
+    gap_nodes = nodes[layout["gap"][nodes]]
+    if len(gap_nodes):
+        st.markdown(f"### 🕳️ Gaps to fill ({len(gap_nodes)})")
+
+        tree_html = '<div class="tree-view">'
+        for index in gap_nodes[:100]:
+            parent = layout["parent"][index]
+            tree_html += f'<div class="tree-item">📁 {format_key_display(layout["label"][parent])} > <b>{format_key_display(layout["label"][index])}</b></div>'
+        tree_html += '</div>'
+
+        st.markdown(tree_html, unsafe_allow_html=True)
 
 def main():
-    # Load data
-    data, original_data = load_data()
+    # Open the knowledge map storage
+    storage = get_storage()
 
     # Header
     st.markdown("""
@@ -664,30 +866,50 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
+    # A missing or broken learn.yaml can't be browsed, so report it like load_data does
+    try:
+        storage.kind([])
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        return
+
     # Main navigation tabs
-    tab1, tab2 = st.tabs(["📚 Explore Knowledge", "✏️ Build Your Knowledge Map"])
+    tab1, tab2, tab3 = st.tabs(["📚 Explore Knowledge", "✏️ Build Your Knowledge Map", "🌳 Knowledge Overview"])
 
     with tab1:
-        browse_topics(data)
+        browse_topics(storage)
 
     with tab2:
-        # Interactive knowledge building
-        current_data, parent_stack = build_knowledge_tree(data)
+        # Interactive knowledge building; every edit is saved as soon as it's made
+        build_knowledge_tree(storage)
 
-        # Save changes button (only show if changes were made)
-        if current_data != original_data:
+        # Keep learn.yaml in sync with the database
+        if isinstance(storage, SqliteStorage):
             st.markdown("---")
 
-            # Center the save button
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                if st.button("💾 Save All Changes", use_container_width=True):
-                    # Save changes to file
-                    if save_data(current_data):
-                        st.success("Your knowledge map has been updated!")
-                        st.balloons()
+            col1, col2 = st.columns([1, 1])
+            with col1:
+                if st.button("📤 Export to learn.yaml", use_container_width=True):
+                    if save_data(storage.export_data()):
+                        st.success("Your knowledge map has been exported to learn.yaml!")
                     else:
-                        st.error("There was a problem saving your changes.")
+                        st.error("There was a problem exporting your knowledge map.")
+
+            with col2:
+                # Importing replaces the whole map, so ask first like every other delete
+                confirm_import = st.checkbox("Replace my map with learn.yaml, losing changes that weren't exported")
+                if st.button("📥 Import from learn.yaml", use_container_width=True, disabled=not confirm_import,
+                             help="Replace the map with the contents of learn.yaml"):
+                    data = load_data()
+                    if data is None:
+                        st.error("Couldn't read learn.yaml, so nothing was imported.")
+                    elif not data:
+                        st.warning("learn.yaml is empty, so nothing was imported.")
+                    elif commit_edit(storage.import_data, data):
+                        st.success("Your knowledge map has been reloaded from learn.yaml!")
+
+    with tab3:
+        show_knowledge_overview(storage)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,458 @@
+import copy
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+import numpy as np
+import yaml
+
+
+class Storage(ABC):
+    """Interface for where the knowledge map lives.
+
+    Nodes are addressed by their path of keys from the root, e.g.
+    ["Economics", "Foundations"]; the empty path is the whole map.
+    """
+
+    @abstractmethod
+    def version(self):
+        """Token that changes whenever the map changes (0 if never written)"""
+
+    @abstractmethod
+    def kind(self, path):
+        """Kind of the node at path: 'dict', 'list', 'str' or 'scalar'"""
+
+    @abstractmethod
+    def children(self, path):
+        """Map each child key of the category at path to its kind"""
+
+    @abstractmethod
+    def get(self, path):
+        """Load the subtree at path as plain dicts, lists and strings"""
+
+    @abstractmethod
+    def set(self, path, value):
+        """Create or replace the subtree at path"""
+
+    @abstractmethod
+    def delete(self, path):
+        """Remove the subtree at path"""
+
+    def import_data(self, data):
+        """Replace the whole map, e.g. with the contents of learn.yaml"""
+        self.set([], data)
+
+    def export_data(self):
+        """Load the whole map, e.g. to write it back to learn.yaml"""
+        return self.get([])
+
+    def preorder(self):
+        """Flatten the whole map in pre-order into labels, parent indexes, depths and gap flags"""
+        labels, parents, depths, gaps = [], [], [], []
+
+        # Iterative walk so deep maps don't hit the recursion limit
+        stack = [("", -1, 0, self.get([]))]
+        while stack:
+            label, parent, depth, value = stack.pop()
+            index = len(labels)
+            labels.append(label)
+            parents.append(parent)
+            depths.append(depth)
+            gaps.append(is_gap(value))
+
+            if isinstance(value, dict):
+                children = [(str(key), child) for key, child in value.items()]
+            elif isinstance(value, list):
+                children = [(item_label(item, position), item) for position, item in enumerate(value)]
+            else:
+                children = []
+
+            for key, child in reversed(children):
+                stack.append((key, index, depth + 1, child))
+
+        return labels, parents, depths, gaps
+
+
+def kind_of(value):
+    """Storage kind for a YAML value"""
+    if isinstance(value, dict):
+        return "dict"
+    if isinstance(value, list):
+        return "list"
+    if isinstance(value, str):
+        return "str"
+    return "scalar"
+
+
+def is_gap(value):
+    """A topic is a gap when it has no description or no content yet"""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    if isinstance(value, (dict, list)):
+        return len(value) == 0
+    return False
+
+
+def item_label(item, position):
+    """Label for a list item: its text, the key of a one-key mapping, or 'Item N'"""
+    if isinstance(item, dict) and len(item) == 1:
+        return str(next(iter(item)))
+    if isinstance(item, (dict, list)):
+        return f"Item {position + 1}"
+    return str(item)
+
+
+def encode_scalar(value):
+    """Text form of a YAML scalar, tagged 'str' for plain strings and 'scalar' otherwise"""
+    if isinstance(value, str):
+        return "str", value
+    return "scalar", yaml.safe_dump(value)
+
+
+def decode_scalar(kind, stored):
+    """Inverse of encode_scalar"""
+    return stored if kind == "str" else yaml.safe_load(stored)
+
+
+def path_name(path):
+    """Readable form of a key path for error messages"""
+    return "/".join(str(key) for key in path)
+
+
+class YamlStorage(Storage):
+    """The whole map in a single YAML file, parsed once per file version and rewritten on every edit"""
+
+    def __init__(self, path="learn.yaml"):
+        self.path = path
+        self._cache = (None, None)
+
+    def _load(self):
+        """Parsed file contents, reused until the file's mtime or size changes"""
+        version = self.version()
+        if self._cache[0] != version:
+            with open(self.path, "r") as file:
+                self._cache = (version, yaml.safe_load(file) or {})
+        return self._cache[1]
+
+    def _save(self, data):
+        with open(self.path, "w") as file:
+            yaml.dump(data, file, default_flow_style=False, sort_keys=False)
+        self._cache = (self.version(), data)
+
+    def _resolve(self, data, path):
+        for key in path:
+            if not isinstance(data, dict) or key not in data:
+                raise KeyError(path_name(path))
+            data = data[key]
+        return data
+
+    def version(self):
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return 0
+
+    def kind(self, path):
+        return kind_of(self._resolve(self._load(), path))
+
+    def children(self, path):
+        node = self._resolve(self._load(), path)
+        if not isinstance(node, dict):
+            raise ValueError(f"'{path_name(path)}' is not a category")
+        return {key: kind_of(value) for key, value in node.items()}
+
+    def get(self, path):
+        return self._resolve(self._load(), path)
+
+    def set(self, path, value):
+        if not path:
+            self._save(value)
+            return
+
+        data = copy.deepcopy(self._load())
+        parent = self._resolve(data, path[:-1])
+        if not isinstance(parent, dict):
+            raise ValueError(f"'{path_name(path[:-1])}' is not a category")
+        parent[path[-1]] = value
+        self._save(data)
+
+    def delete(self, path):
+        if not path:
+            raise ValueError("Cannot delete the whole knowledge map")
+
+        data = copy.deepcopy(self._load())
+        parent = self._resolve(data, path[:-1])
+        if not isinstance(parent, dict) or path[-1] not in parent:
+            raise KeyError(path_name(path))
+        del parent[path[-1]]
+        self._save(data)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER,
+    path TEXT NOT NULL,
+    key_kind TEXT,
+    key TEXT,
+    position INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS nodes_path ON nodes (path);
+CREATE INDEX IF NOT EXISTS nodes_children ON nodes (parent_id, position);
+CREATE UNIQUE INDEX IF NOT EXISTS nodes_key ON nodes (parent_id, key_kind, key);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+ROOT_ID = 1
+
+# Key of the root and of list items, which unlike a YAML null key is not stored
+NO_KEY = object()
+
+
+def subtree_bounds(path):
+    """Range of materialized paths inside the subtree rooted at path.
+
+    Paths look like '/1/42/97/'. Every descendant of '/1/42/' sorts before
+    '/1/420' because '/' comes right before '0', so a subtree is one range
+    scan on the path index.
+    """
+    return path, path[:-1] + "0"
+
+
+class SqliteStorage(Storage):
+    """One row per node in a SQLite database, with materialized paths for subtree reads.
+
+    Each read fetches only the node or subtree it needs, and each edit is a
+    single short transaction. WAL mode lets several sessions read while one
+    of them writes.
+    """
+
+    def __init__(self, path="learn.db"):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+
+    def _connection(self):
+        """This thread's connection, opened on first use and kept for later calls"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self, write=False):
+        """Run a read, or a write that bumps the version, as one transaction"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+        try:
+            yield conn
+            if write:
+                conn.execute(
+                    "INSERT INTO meta (name, value) VALUES ('version', 1) "
+                    "ON CONFLICT (name) DO UPDATE SET value = value + 1"
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            # Also covers a failed COMMIT, so the shared connection never stays mid-transaction
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def _locate(self, conn, path):
+        """Find (id, path, kind, position) of the node at path, one key lookup per level"""
+        node = conn.execute(
+            "SELECT id, path, kind, position FROM nodes WHERE id = ?", (ROOT_ID,)
+        ).fetchone()
+        for key in path:
+            if node is None or node[2] != "dict":
+                node = None
+                break
+            node = conn.execute(
+                "SELECT id, path, kind, position FROM nodes WHERE parent_id = ? AND key_kind = ? AND key = ?",
+                (node[0], *encode_scalar(key))
+            ).fetchone()
+        if node is None:
+            raise KeyError(path_name(path))
+        return node
+
+    def _rows(self, value, node_id, parent_id, parent_path, key, position):
+        """Flatten a value into node rows, numbering ids upwards from node_id"""
+        rows = []
+        stack = [(value, parent_id, parent_path, key, position)]
+        while stack:
+            value, parent_id, parent_path, key, position = stack.pop()
+            path = f"{parent_path}{node_id}/"
+            kind = kind_of(value)
+            stored = None if kind in ("dict", "list") else encode_scalar(value)[1]
+            key_kind, stored_key = (None, None) if key is NO_KEY else encode_scalar(key)
+            rows.append((node_id, parent_id, path, key_kind, stored_key, position, kind, stored))
+
+            if kind == "dict":
+                for child_position, (child_key, child) in enumerate(value.items()):
+                    stack.append((child, node_id, path, child_key, child_position))
+            elif kind == "list":
+                for child_position, child in enumerate(value):
+                    stack.append((child, node_id, path, NO_KEY, child_position))
+
+            node_id += 1
+        return rows
+
+    def _insert(self, conn, rows):
+        conn.executemany(
+            "INSERT INTO nodes (id, parent_id, path, key_kind, key, position, kind, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+
+    def version(self):
+        with self._transaction() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        return row[0] if row else 0
+
+    def kind(self, path):
+        with self._transaction() as conn:
+            return self._locate(conn, path)[2]
+
+    def children(self, path):
+        with self._transaction() as conn:
+            node_id, _, kind, _ = self._locate(conn, path)
+            if kind != "dict":
+                raise ValueError(f"'{path_name(path)}' is not a category")
+            rows = conn.execute(
+                "SELECT key_kind, key, kind FROM nodes WHERE parent_id = ? ORDER BY position", (node_id,)
+            ).fetchall()
+        return {decode_scalar(key_kind, key): kind for key_kind, key, kind in rows}
+
+    def get(self, path):
+        with self._transaction() as conn:
+            node_id, node_path, _, _ = self._locate(conn, path)
+            rows = conn.execute(
+                "SELECT id, parent_id, key_kind, key, kind, value FROM nodes "
+                "WHERE path >= ? AND path < ? ORDER BY parent_id, position",
+                subtree_bounds(node_path)
+            ).fetchall()
+
+        values = {}
+        for row_id, _, _, _, kind, stored in rows:
+            if kind == "dict":
+                values[row_id] = {}
+            elif kind == "list":
+                values[row_id] = []
+            else:
+                values[row_id] = decode_scalar(kind, stored)
+
+        # Rows come grouped by parent in position order, so children attach in order
+        for row_id, parent_id, key_kind, key, _, _ in rows:
+            if row_id == node_id:
+                continue
+            parent = values[parent_id]
+            if isinstance(parent, dict):
+                parent[decode_scalar(key_kind, key)] = values[row_id]
+            else:
+                parent.append(values[row_id])
+
+        return values[node_id]
+
+    def preorder(self):
+        """Read the flattened map straight from the nodes table, without building nested dicts.
+
+        Sorting by materialized path is a pre-order walk with every subtree
+        contiguous. Only four small columns are read per node; the few rows
+        whose label isn't a plain string key are looked up afterwards.
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, COALESCE(parent_id, 0), key, "
+                "(kind = 'dict') + 2 * (kind = 'list') + 4 * (key_kind IS NOT 'str') + 8 * ("
+                "(kind = 'str' AND trim(value, ' ' || char(9, 10, 13)) = '') OR (kind = 'scalar' AND value = ?)"
+                ") FROM nodes ORDER BY path",
+                (encode_scalar(None)[1],)
+            ).fetchall()
+            count = len(rows)
+            labels = [row[2] for row in rows]
+            flags = np.fromiter((row[3] for row in rows), np.int8, count)
+            unlabelled = np.flatnonzero(flags & 4)
+            details = [
+                conn.execute(
+                    "SELECT key_kind, key, kind, value, position FROM nodes WHERE id = ?", (rows[i][0],)
+                ).fetchone()
+                for i in unlabelled
+            ]
+
+        # Map parent ids to row indexes; the root's parent (0) maps to -1
+        ids = np.fromiter((row[0] for row in rows), np.int64, count)
+        index = np.full(ids.max() + 1, -1, dtype=np.int64)
+        index[ids] = np.arange(count)
+        parents = index[np.fromiter((row[1] for row in rows), np.int64, count)]
+
+        # Depth is the number of ancestors, found by jumping one level up per pass
+        depths = np.zeros(count, dtype=np.int32)
+        ancestor = parents.copy()
+        while (ancestor >= 0).any():
+            above = ancestor >= 0
+            depths += above
+            ancestor[above] = parents[ancestor[above]]
+
+        # Categories and lists without children are gaps too
+        child_count = np.bincount(parents[1:], minlength=count)
+        gaps = (flags & 8).astype(bool) | ((flags & 3).astype(bool) & (child_count == 0))
+
+        # Go backwards so a one-key mapping list item can take its only child's final label
+        for i, (key_kind, key, kind, value, position) in reversed(list(zip(unlabelled, details))):
+            if key_kind is not None:
+                labels[i] = str(decode_scalar(key_kind, key))
+            elif kind in ("str", "scalar"):
+                labels[i] = str(decode_scalar(kind, value))
+            elif kind == "dict" and child_count[i] == 1:
+                labels[i] = labels[i + 1]
+            else:
+                labels[i] = f"Item {position + 1}"
+
+        return labels, parents, depths, gaps
+
+    def set(self, path, value):
+        with self._transaction(write=True) as conn:
+            if not path:
+                conn.execute("DELETE FROM nodes")
+                self._insert(conn, self._rows(value, ROOT_ID, None, "/", NO_KEY, 0))
+                return
+
+            parent_id, parent_path, parent_kind, _ = self._locate(conn, path[:-1])
+            if parent_kind != "dict":
+                raise ValueError(f"'{path_name(path[:-1])}' is not a category")
+
+            existing = conn.execute(
+                "SELECT path, position FROM nodes WHERE parent_id = ? AND key_kind = ? AND key = ?",
+                (parent_id, *encode_scalar(path[-1]))
+            ).fetchone()
+            if existing:
+                conn.execute("DELETE FROM nodes WHERE path >= ? AND path < ?", subtree_bounds(existing[0]))
+                position = existing[1]
+            else:
+                position = conn.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM nodes WHERE parent_id = ?", (parent_id,)
+                ).fetchone()[0]
+
+            next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM nodes").fetchone()[0]
+            self._insert(conn, self._rows(value, next_id, parent_id, parent_path, path[-1], position))
+
+    def delete(self, path):
+        if not path:
+            raise ValueError("Cannot delete the whole knowledge map")
+
+        with self._transaction(write=True) as conn:
+            node_path = self._locate(conn, path)[1]
+            conn.execute("DELETE FROM nodes WHERE path >= ? AND path < ?", subtree_bounds(node_path))